@@ -1,12 +1,54 @@
 import streamlit as st
 import io
 import os
-from datetime import datetime
+import time
+from collections import namedtuple
+from dataclasses import dataclass
 
 # --- 常數定義 ---
 PAGE_TITLE = "Kuro家｜貓咪飲食計畫產生器"
 PAGE_ICON = "🐈‍"
 
+# 報告中固定不變的文字，於載入時組好一次，每次產生報告直接引用
+REPORT_SECTION_END = "--------------------------------------\n\n"
+REPORT_FOOTER = f"""ℹ️ 免責聲明與重要提示：
+
+此工具提供的熱量需求為估算值，基於常用公式和參考數據。
+每隻貓咪的代謝、活動量、健康狀況、品種及個別差異都可能影響實際熱量需求。
+在任何飲食調整（特別是增重或減重計畫）前，請務必諮詢您的獸醫或專業寵物營養師，
+獲取最精確的建議與指導，以確保貓咪的健康與安全。
+本工具不提供醫療診斷或治療建議。
+
+--------------------------------------
+{PAGE_TITLE} (僅供參考)"""
+
+# 體重輸入以 0.1 公斤為單位 (0.1 ~ 20.0)，預先算好每一格的 RER
+RER_TABLE = [70 * ((i / 10) ** 0.75) for i in range(1, 201)]
+
+# 成貓/老年貓的活動係數表: [成貓, 老年貓][未絕育, 已絕育][過輕 (BCS<4), 理想, 過重 (BCS>5)]
+ACTIVITY_MULTIPLIERS = (
+    ((1.8, 1.4, 1.0), (1.6, 1.2, 0.8)),
+    ((1.2, 1.0, 0.8), (1.2, 1.0, 0.8)),
+)
+
+# --- 資料結構 ---
+@dataclass(slots=True)
+class CatInfo:
+    """第一步輸入的貓咪基本資料，預設值即第一步表單的初始值。"""
+    weight: float = 4.0
+    age_years: int = 2
+    age_months: int = 0
+    is_neutered: str = '是'
+    is_neutered_bool: bool = True
+    bcs: int = 5
+    is_pregnant: bool = False
+    is_lactating: bool = False
+
+# 飲食報告的單一區塊: 標題、欄位列表、文字報告用的補充說明、畫面用的說明文字
+ReportSection = namedtuple('ReportSection', 'title rows note caption', defaults=(None, None))
+# 區塊中的單一欄位；delta 與 delta_color 只用於第四步畫面的 st.metric
+ReportRow = namedtuple('ReportRow', 'label value delta delta_color', defaults=(None, "normal"))
+
 # --- 輔助函數 ---
 def calculate_rer(weight_kg):
     """
@@ -16,112 +58,140 @@ def calculate_rer(weight_kg):
     if weight_kg <= 0:
         st.error("體重必須大於零。")
         return None
+    index = round(weight_kg * 10)
+    if 1 <= index <= len(RER_TABLE) and abs(weight_kg * 10 - index) < 1e-6:
+        return RER_TABLE[index - 1]
     return 70 * (float(weight_kg)**0.75)
 
 def get_activity_multiplier(age_months, is_neutered, bcs, is_pregnant=False, is_lactating=False):
     """根據貓咪的年齡、絕育狀態、BCS、懷孕/哺乳狀態，返回活動係數。"""
-    multiplier = 1.0 # 預設值
-
     if is_pregnant:
         return 2.0 # 懷孕貓咪
     if is_lactating:
         return 3.0 # 哺乳貓咪 (簡化，可以根據幼貓數量調整)
 
+    # 幼貓不考慮絕育與 BCS
     if age_months < 4:
-        multiplier = 3.0
-    elif age_months >= 4 and age_months <= 12:
-        multiplier = 2.0
-    elif age_months > 12 and age_months < 84: # 假設1到7歲是成貓
-        if is_neutered:
-            multiplier = 1.2 # 絕育成貓
-            if bcs > 5: # 體重過重，目標減肥
-                multiplier = 0.8
-            elif bcs < 4: # 體重過輕，目標增重
-                multiplier = 1.6
-        else:
-            multiplier = 1.4 # 未絕育成貓
-            if bcs > 5: # 體重過重
-                multiplier = 1.0
-            elif bcs < 4: # 體重過輕
-                multiplier = 1.8
-    else: # age_months >= 84 (老年貓)
-        multiplier = 1.0
-        if bcs > 5: # 體重過重
-            multiplier = 0.8
-        elif bcs < 4: # 體重過輕
-            multiplier = 1.2
-
-    return multiplier
+        return 3.0
+    if age_months <= 12:
+        return 2.0
+
+    life_stage = 0 if age_months < 84 else 1 # 假設1到7歲是成貓
+    bcs_bucket = 0 if bcs < 4 else (2 if bcs > 5 else 1)
+    return ACTIVITY_MULTIPLIERS[life_stage][int(bool(is_neutered))][bcs_bucket]
+
+@st.cache_data(show_spinner=False)
+def calculate_der(weight_kg, age_months, is_neutered, bcs, is_pregnant=False, is_lactating=False):
+    """計算 RER、活動係數與每日建議熱量 (DER)，相同輸入直接使用快取結果。"""
+    rer = calculate_rer(weight_kg)
+    if rer is None:
+        return None
+    multiplier = get_activity_multiplier(age_months, is_neutered, bcs, is_pregnant, is_lactating)
+    return {"rer": rer, "multiplier": multiplier, "der": rer * multiplier}
 
-def generate_text_report(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan): # 調整參數順序
-    report_text = f"--- 🐱 貓咪飲食報告 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n\n"
-
-    report_text += "📋 貓咪基本資料:\n"
-    report_text += f"- 體重: {cat_info.get('weight', 0):.2f} 公斤\n"
-    report_text += f"- 年齡: {cat_info.get('age_years', 0)} 歲 {cat_info.get('age_months', 0)} 個月\n"
-    report_text += f"- BCS: {cat_info.get('bcs', 0)} / 9\n"
-    report_text += f"- 絕育狀態: {cat_info.get('is_neutered', '未知')}\n"
-    if cat_info.get('is_pregnant', False):
-        report_text += f"- 生理狀態: 懷孕中\n"
-    if cat_info.get('is_lactating', False):
-        report_text += f"- 生理狀態: 哺乳中\n"
-    report_text += "--------------------------------------\n\n"
-
-    report_text += "📈 每日建議攝取:\n"
-    report_text += f"- 建議熱量 (DER): {der_info.get('der', 0):.2f} 大卡/天\n"
-    report_text += "--------------------------------------\n\n"
+@st.cache_data(show_spinner=False)
+def calculate_feeding_grams(der, wet_food_percentage, dry_food_kcal_per_1000g, wet_food_kcal_per_100g):
+    """依乾濕食熱量佔比，返回每日建議的 (乾食公克數, 濕食公克數)。"""
+    target_wet_calories = der * (wet_food_percentage / 100.0)
+    target_dry_calories = der * ((100 - wet_food_percentage) / 100.0)
+
+    required_dry_grams = 0.0
+    if dry_food_kcal_per_1000g > 0:
+        required_dry_grams = (target_dry_calories / dry_food_kcal_per_1000g) * 1000.0
+
+    required_wet_grams = 0.0
+    if wet_food_kcal_per_100g > 0:
+        required_wet_grams = (target_wet_calories / wet_food_kcal_per_100g) * 100.0
+
+    return required_dry_grams, required_wet_grams
+
+@st.cache_data(show_spinner=False)
+def build_report_sections(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan):
+    """
+    整理飲食報告的各個區塊，第四步畫面與文字報告共用同一份內容。
+    每個區塊為 ReportSection，rows 為 ReportRow 的列表。
+    """
+    basic_rows = [
+        ReportRow("體重", f"{cat_info.weight:.2f} 公斤"),
+        ReportRow("年齡", f"{cat_info.age_years} 歲 {cat_info.age_months} 個月"),
+        ReportRow("BCS", f"{cat_info.bcs} / 9"),
+        ReportRow("絕育狀態", cat_info.is_neutered),
+    ]
+    if cat_info.is_pregnant:
+        basic_rows.append(ReportRow("生理狀態", "懷孕中"))
+    if cat_info.is_lactating:
+        basic_rows.append(ReportRow("生理狀態", "哺乳中"))
+    sections = [
+        ReportSection("📋 貓咪基本資料", basic_rows),
+        ReportSection("📈 每日建議攝取", [ReportRow("建議熱量 (DER)", f"{der_info.get('der', 0):.2f} 大卡/天")]),
+    ]
 
     if intake_analysis:
-        report_text += "📊 目前飲食分析:\n"
-        report_text += f"- 從乾乾攝取的熱量: {intake_analysis.get('dry_food_kcal', 0):.2f} 大卡\n"
-        report_text += f"- 從濕食攝取的熱量: {intake_analysis.get('wet_food_kcal', 0):.2f} 大卡\n"
-        report_text += f"- 每日總攝取熱量: {intake_analysis.get('total_intake', 0):.2f} 大卡\n"
         diff = intake_analysis.get('calorie_difference', 0)
-        report_text += f"- 與建議量差異: {diff:+.2f} 大卡\n"
         if diff > 5:
-            report_text += "(攝取超標，建議調整)\n"
+            intake_note = "攝取超標，建議調整"
+            delta_text = f"+{diff:.2f} 大卡"
+            delta_color = "inverse"
         elif diff < -5:
-            report_text += "(攝取不足，建議調整)\n"
+            intake_note = "攝取不足，建議調整"
+            delta_text = f"{diff:.2f} 大卡"
+            delta_color = "off"
         else:
-            report_text += "(熱量攝取接近建議值)\n"
-        report_text += "--------------------------------------\n\n"
+            intake_note = "熱量攝取接近建議值"
+            delta_text = "接近理想"
+            delta_color = "normal"
+        sections.append(ReportSection("📊 目前飲食分析", [
+            ReportRow("從乾乾攝取的熱量", f"{intake_analysis.get('dry_food_kcal', 0):.2f} 大卡"),
+            ReportRow("從濕食攝取的熱量", f"{intake_analysis.get('wet_food_kcal', 0):.2f} 大卡"),
+            ReportRow("每日總攝取熱量", f"{intake_analysis.get('total_intake', 0):.2f} 大卡"),
+            ReportRow("與建議量差異", f"{diff:+.2f} 大卡", delta_text, delta_color),
+        ], note=intake_note))
     else:
-        report_text += "📊 目前飲食分析: 尚未輸入餵食資訊，無法分析。\n"
-        report_text += "--------------------------------------\n\n"
-    
+        sections.append(ReportSection("📊 目前飲食分析", [], note="尚未輸入餵食資訊，無法分析。"))
+
     # 將伙食費顯示在飲食分析後面
     if monthly_cost_info and monthly_cost_info.get('total_monthly_cost') is not None:
-        report_text += "💰 目前每月伙食費:\n" # 修改標題
-        report_text += f"- 每日乾食花費: {monthly_cost_info.get('daily_dry_cost', 0):.2f} 元\n"
-        report_text += f"- 每日濕食花費: {monthly_cost_info.get('daily_wet_cost', 0):.2f} 元\n"
-        report_text += f"- 每月總伙食費: {monthly_cost_info.get('total_monthly_cost', 0):.2f} 元 (以30天計)\n"
-        report_text += "--------------------------------------\n\n"
+        sections.append(ReportSection("💰 目前每月伙食費", [
+            ReportRow("每日乾食花費", f"{monthly_cost_info.get('daily_dry_cost', 0):.2f} 元"),
+            ReportRow("每日濕食花費", f"{monthly_cost_info.get('daily_wet_cost', 0):.2f} 元"),
+            ReportRow("每日總花費", f"{monthly_cost_info.get('total_daily_cost', 0):.2f} 元"),
+            ReportRow("每月總伙食費", f"{monthly_cost_info.get('total_monthly_cost', 0):.2f} 元 (以30天計)"),
+        ], caption="此為根據您輸入的食物價格和每日餵食量估算，以30天計。"))
     else:
-        report_text += "💰 目前每月伙食費: 尚未輸入食物價格資訊，無法估算。\n" # 修改標題
-        report_text += "--------------------------------------\n\n"
+        sections.append(ReportSection("💰 目前每月伙食費", [], note="尚未輸入食物價格資訊，無法估算。"))
 
     if feeding_plan and feeding_plan.get('target_kcal') is not None:
-        report_text += "🥗 建議餵食計畫:\n"
-        report_text += f"目標熱量約: {feeding_plan.get('target_kcal', 0):.0f} 大卡/天\n"
-        report_text += f"熱量佔比: {100 - feeding_plan.get('wet_food_percentage', 0)}% 乾食 / {feeding_plan.get('wet_food_percentage', 0)}% 濕食\n"
-        report_text += f"- 建議乾食餵食量: {feeding_plan.get('required_dry_grams', 0):.1f} 公克/天\n"
-        report_text += f"- 建議濕食餵食量: {feeding_plan.get('required_wet_grams', 0):.1f} 公克/天\n"
-        report_text += "--------------------------------------\n\n"
+        wet_pct = feeding_plan.get('wet_food_percentage', 0)
+        sections.append(ReportSection("🥗 建議餵食計畫", [
+            ReportRow("目標熱量約", f"{feeding_plan.get('target_kcal', 0):.0f} 大卡/天"),
+            ReportRow("熱量佔比", f"{100 - wet_pct}% 乾食 / {wet_pct}% 濕食"),
+            ReportRow("建議乾食餵食量", f"{feeding_plan.get('required_dry_grams', 0):.1f} 公克/天"),
+            ReportRow("建議濕食餵食量", f"{feeding_plan.get('required_wet_grams', 0):.1f} 公克/天"),
+        ], caption="此為粗略建議，請諮詢獸醫獲取精確處方糧或食譜。"))
     else:
-        report_text += "🥗 建議餵食計畫: 尚未計算或無有效食物熱量資訊。\n"
-        report_text += "--------------------------------------\n\n"
-    
-    report_text += "ℹ️ 免責聲明與重要提示：\n"
-    report_text += """
-此工具提供的熱量需求為估算值，基於常用公式和參考數據。
-每隻貓咪的代謝、活動量、健康狀況、品種及個別差異都可能影響實際熱量需求。
-在任何飲食調整（特別是增重或減重計畫）前，請務必諮詢您的獸醫或專業寵物營養師，
-獲取最精確的建議與指導，以確保貓咪的健康與安全。
-本工具不提供醫療診斷或治療建議。
-"""
-    report_text += "\n--------------------------------------"
-    report_text += "\nKuro家｜貓咪飲食計畫產生器 (僅供參考)"
+        sections.append(ReportSection("🥗 建議餵食計畫", [], note="尚未計算或無有效食物熱量資訊。"))
+
+    return sections
 
+def build_report_body(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan):
+    """依 build_report_sections 的快取結果產生報告內文 (不含時間標頭)。"""
+    # 逐行收集後一次組合，避免反覆串接字串
+    report_lines = []
+    for section in build_report_sections(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan):
+        if not section.rows:
+            report_lines.append(f"{section.title}: {section.note}\n")
+        else:
+            report_lines.append(f"{section.title}:\n")
+            report_lines.extend(f"- {row.label}: {row.value}\n" for row in section.rows)
+            if section.note:
+                report_lines.append(f"({section.note})\n")
+        report_lines.append(REPORT_SECTION_END)
+    report_lines.append(REPORT_FOOTER)
+    return "".join(report_lines)
+
+def generate_text_report(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan): # 調整參數順序
+    report_text = f"--- 🐱 貓咪飲食報告 - {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n\n"
+    report_text += build_report_body(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan)
     return report_text
 
 # --- 主要應用程式邏輯 ---
@@ -134,7 +204,7 @@ def main():
         st.session_state.current_step = 1
     # 初始化所有可能需要跨步驟存儲的變量
     if 'der' not in st.session_state: st.session_state.der = None
-    if 'cat_info' not in st.session_state: st.session_state.cat_info = {}
+    if 'cat_info' not in st.session_state: st.session_state.cat_info = CatInfo()
     if 'der_info' not in st.session_state: st.session_state.der_info = {}
     if 'intake_analysis' not in st.session_state: st.session_state.intake_analysis = None
     if 'feeding_plan' not in st.session_state: st.session_state.feeding_plan = None
@@ -157,25 +227,25 @@ def main():
         st.info("請輸入貓咪的詳細基本資料，以估算其每日所需的熱量。")
 
         # 使用 session_state 中的值作為預設值
-        weight_s1 = st.number_input("體重 (公斤)", min_value=0.1, max_value=20.0, value=st.session_state.cat_info.get('weight', 4.0), step=0.1, key="weight_s1")
-        age_years_s1 = st.number_input("年齡 (歲)", min_value=0, max_value=25, value=st.session_state.cat_info.get('age_years', 2), step=1, key="age_years_s1")
-        age_months_s1 = st.number_input("年齡 (個月)", min_value=0, max_value=11, value=st.session_state.cat_info.get('age_months', 0), step=1, key="age_months_s1")
+        weight_s1 = st.number_input("體重 (公斤)", min_value=0.1, max_value=20.0, value=st.session_state.cat_info.weight, step=0.1, key="weight_s1")
+        age_years_s1 = st.number_input("年齡 (歲)", min_value=0, max_value=25, value=st.session_state.cat_info.age_years, step=1, key="age_years_s1")
+        age_months_s1 = st.number_input("年齡 (個月)", min_value=0, max_value=11, value=st.session_state.cat_info.age_months, step=1, key="age_months_s1")
         
         is_neutered_s1_options = ('是', '否')
-        is_neutered_s1_index = is_neutered_s1_options.index(st.session_state.cat_info.get('is_neutered', '是'))
+        is_neutered_s1_index = is_neutered_s1_options.index(st.session_state.cat_info.is_neutered)
         is_neutered_s1_display = st.radio("是否已絕育？", is_neutered_s1_options, index=is_neutered_s1_index, key="is_neutered_s1")
         is_neutered_s1 = (is_neutered_s1_display == '是')
         
         with st.container(border=True):
-            bcs_s1 = st.slider("請家長目視/觸摸，為貓咪做BCS身體狀況評分 (1:過瘦, 5:理想, 9:過胖，拖拉可選擇分數)", min_value=1, max_value=9, value=st.session_state.cat_info.get('bcs', 5), key="bcs_s1")
+            bcs_s1 = st.slider("請家長目視/觸摸，為貓咪做BCS身體狀況評分 (1:過瘦, 5:理想, 9:過胖，拖拉可選擇分數)", min_value=1, max_value=9, value=st.session_state.cat_info.bcs, key="bcs_s1")
             st.caption("""
             - **1-3分 (過瘦):** 肋骨、脊椎易見且突出。
             - **4-5分 (理想):** 肋骨可觸及，腰身明顯。
             - **6-7分 (過重):** 肋骨不易觸及，腰身不明顯。
             - **8-9分 (肥胖):** 肋骨難以觸及，腹部明顯下垂。
             """)
-        is_pregnant_s1 = st.checkbox("母貓是否懷孕？", value=st.session_state.cat_info.get('is_pregnant', False), key="is_pregnant_s1")
-        is_lactating_s1 = st.checkbox("母貓是否哺乳中？", value=st.session_state.cat_info.get('is_lactating', False), key="is_lactating_s1")
+        is_pregnant_s1 = st.checkbox("母貓是否懷孕？", value=st.session_state.cat_info.is_pregnant, key="is_pregnant_s1")
+        is_lactating_s1 = st.checkbox("母貓是否哺乳中？", value=st.session_state.cat_info.is_lactating, key="is_lactating_s1")
         
         st.markdown("---")
         
@@ -186,21 +256,18 @@ def main():
             if age <= 0:
                 st.error("貓咪總年齡必須大於 0 個月，請重新輸入。")
             else:
-                rer = calculate_rer(weight_s1)
-                if rer is not None:
-                    multiplier = get_activity_multiplier(age, is_neutered_s1, bcs_s1, is_pregnant_s1, is_lactating_s1)
-                    der = rer * multiplier
+                der_info = calculate_der(weight_s1, age, is_neutered_s1, bcs_s1, is_pregnant_s1, is_lactating_s1)
+                if der_info is not None:
+                    rer, multiplier, der = der_info["rer"], der_info["multiplier"], der_info["der"]
                     st.session_state.der = der
 
                     # 將輸入值保存到 session_state，供下次加載或報告使用
-                    st.session_state.cat_info = {
-                        "weight": weight_s1, "age_years": age_years_s1, "age_months": age_months_s1,
-                        "is_neutered": is_neutered_s1_display, "is_neutered_bool": is_neutered_s1,
-                        "bcs": bcs_s1, "is_pregnant": is_pregnant_s1, "is_lactating": is_lactating_s1
-                    }
-                    st.session_state.der_info = {
-                        "rer": rer, "multiplier": multiplier, "der": der
-                    }
+                    st.session_state.cat_info = CatInfo(
+                        weight=weight_s1, age_years=age_years_s1, age_months=age_months_s1,
+                        is_neutered=is_neutered_s1_display, is_neutered_bool=is_neutered_s1,
+                        bcs=bcs_s1, is_pregnant=is_pregnant_s1, is_lactating=is_lactating_s1
+                    )
+                    st.session_state.der_info = der_info
 
                     st.subheader("📈 計算結果")
                     st.write(f"靜息能量需求 (RER): **{rer:.2f} 大卡/天**")
@@ -357,16 +424,10 @@ def main():
             # 步驟3的「計算」按鈕
             if st.button("✅ 產生建議餵食量", key="generate_plan_s3_btn"):
                 der = st.session_state.der
-                target_wet_calories = der * (wet_food_percentage_s3 / 100.0)
-                target_dry_calories = der * ((100 - wet_food_percentage_s3) / 100.0)
-
-                required_dry_grams = 0.0
-                if st.session_state.dry_food_kcal_per_1000g > 0:
-                    required_dry_grams = (target_dry_calories / st.session_state.dry_food_kcal_per_1000g) * 1000.0
-                
-                required_wet_grams = 0.0
-                if st.session_state.wet_food_kcal_per_100g > 0:
-                    required_wet_grams = (target_wet_calories / st.session_state.wet_food_kcal_per_100g) * 100.0
+                required_dry_grams, required_wet_grams = calculate_feeding_grams(
+                    der, wet_food_percentage_s3,
+                    st.session_state.dry_food_kcal_per_1000g, st.session_state.wet_food_kcal_per_100g
+                )
 
                 st.session_state.feeding_plan = {
                     "wet_food_percentage": wet_food_percentage_s3,
@@ -414,62 +475,24 @@ def main():
             st.session_state.monthly_cost_info is None):
             st.warning("⚠️ 報告生成所需資訊不完整。請返回第一步開始填寫所有資訊。")
         else:
-            cat_info = st.session_state.get('cat_info', {})
+            cat_info = st.session_state.get('cat_info', CatInfo())
             der_info = st.session_state.get('der_info', {})
             intake_analysis = st.session_state.get('intake_analysis')
             feeding_plan = st.session_state.get('feeding_plan')
             monthly_cost_info = st.session_state.get('monthly_cost_info')
 
-            st.subheader("🐾 貓咪基本資料")
-            col1, col2 = st.columns(2)
-            col1.metric("體重", f"{cat_info.get('weight', 0):.2f} 公斤")
-            col1.metric("BCS", f"{cat_info.get('bcs', 0)} / 9")
-            col2.metric("年齡", f"{cat_info.get('age_years', 0)} 歲 {cat_info.get('age_months', 0)} 個月")
-            col2.metric("絕育狀態", cat_info.get('is_neutered', '未知'))
-            if cat_info.get('is_pregnant', False) or cat_info.get('is_lactating', False):
-                special_status = []
-                if cat_info.get('is_pregnant', False): special_status.append("懷孕")
-                if cat_info.get('is_lactating', False): special_status.append("哺乳")
-                st.write(f"**特殊生理狀態**: {', '.join(special_status)}")
-            st.markdown("---")
-
-            st.subheader("📈 每日建議攝取")
-            st.metric("建議熱量 (DER)", f"{der_info.get('der', 0):.2f} 大卡/天")
-            st.markdown("---")
-
-            st.subheader("📊 目前飲食分析")
-            col1, col2 = st.columns(2)
-            col1.metric("每日總攝取熱量", f"{intake_analysis.get('total_intake', 0):.2f} 大卡")
-            diff = intake_analysis.get('calorie_difference', 0)
-            if diff > 5:
-                delta_text = f"+{diff:.2f} 大卡"
-                delta_color = "inverse"
-            elif diff < -5:
-                delta_text = f"{diff:.2f} 大卡"
-                delta_color = "off"
-            else:
-                delta_text = "接近理想"
-                delta_color = "normal"
-            col2.metric("與建議量差異", f"{diff:+.2f} 大卡", delta=delta_text, delta_color=delta_color)
-            st.markdown("---")
-
-            # 將伙食費顯示在飲食分析後面
-            if monthly_cost_info:
-                st.subheader("💰 目前每月伙食費") # 修改標題
-                col1, col2 = st.columns(2)
-                col1.metric("每日總花費", f"{monthly_cost_info.get('total_daily_cost', 0):.2f} 元")
-                col2.metric("每月總花費", f"{monthly_cost_info.get('total_monthly_cost', 0):.2f} 元")
-                st.caption("此為根據您輸入的食物價格和每日餵食量估算，以30天計。")
+            for section in build_report_sections(cat_info, der_info, intake_analysis, monthly_cost_info, feeding_plan):
+                st.subheader(section.title)
+                if section.rows:
+                    columns = st.columns(2)
+                    for i, row in enumerate(section.rows):
+                        columns[i % 2].metric(row.label, row.value, delta=row.delta, delta_color=row.delta_color)
+                else:
+                    st.caption(section.note)
+                if section.caption:
+                    st.caption(section.caption)
                 st.markdown("---")
 
-            st.subheader("🥗 建議餵食計畫")
-            st.write(f"基於 **{100 - feeding_plan.get('wet_food_percentage', 0)}% 乾食** 與 **{feeding_plan.get('wet_food_percentage', 0)}% 濕食** 的熱量佔比，目標約 **{feeding_plan.get('target_kcal', 0):.0f} 大卡/天**")
-            col1, col2 = st.columns(2)
-            col1.metric("建議乾食餵食量", f"{feeding_plan.get('required_dry_grams', 0):.1f} 公克/天")
-            col2.metric("建議濕食餵食量", f"{feeding_plan.get('required_wet_grams', 0):.1f} 公克/天")
-            st.caption("此為粗略建議，請諮詢獸醫獲取精確處方糧或食譜。")
-            st.markdown("---")
-            
             st.subheader("📄 一鍵複製飲食報告")
             
             # 調整 generate_text_report 的參數順序